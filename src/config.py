@@ -18,6 +18,8 @@ class Config:
             self.subscriptions_file = github_config.get('subscriptions_file')
             self.freq_days = github_config.get('progress_frequency_days', 1)
             self.exec_time = github_config.get('progress_execution_time', "08:00")
+            # 默认将所有项目报告合并为一封邮件，设置 NOTIFY_PER_REPO=1 则每个项目单独发送
+            self.notify_per_repo = os.getenv('NOTIFY_PER_REPO', '0') == '1'
 
             # 加载 LLM 相关配置
             llm_config = config.get('llm', {})
@@ -25,7 +27,15 @@ class Config:
             self.openai_model_name = llm_config.get('openai_model_name', 'gpt-4o-mini')
             self.ollama_model_name = llm_config.get('ollama_model_name', 'llama3')
             self.ollama_api_url = llm_config.get('ollama_api_url', 'http://localhost:11434/api/chat')
+            self.max_concurrent_llm = llm_config.get('max_concurrent_llm', 4)  # 同时进行的最大模型调用数
+            # 报告缓存配置：相同的提示和内容在有效期内直接复用已生成的报告
+            self.llm_cache_enabled = llm_config.get('cache_enabled', True)
+            self.llm_cache_dir = llm_config.get('cache_dir', 'cache/llm_responses')
+            self.llm_cache_expire_seconds = llm_config.get('cache_expire_seconds', 86400)
             
+            # 加载守护进程需要启用的定时任务，多个任务以逗号分隔
+            self.tasks = config.get('tasks', "github,hn")
+
             # 加载报告类型配置
             self.report_types = config.get('report_types', ["github", "hacker_news"])  # 默认报告类型
             
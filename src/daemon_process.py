@@ -1,94 +1,164 @@
-import schedule # 导入 schedule 实现定时任务执行器
-import time  # 导入time库，用于控制时间间隔
+import asyncio  # 导入asyncio实现基于事件循环的定时任务调度
 import os   # 导入os模块用于文件和目录操作
 import signal  # 导入signal库，用于信号处理
 import sys  # 导入sys库，用于执行系统相关的操作
-from datetime import datetime  # 导入 datetime 模块用于获取当前日期
+from datetime import datetime, timedelta  # 导入 datetime 模块用于获取当前日期及计算下次执行时间
 
 from config import Config  # 导入配置管理类
-from github_client import GitHubClient  # 导入GitHub客户端类，处理GitHub API请求
-from hacker_news_client import HackerNewsClient
 from notifier import Notifier  # 导入通知器类，用于发送通知
 from report_generator import ReportGenerator  # 导入报告生成器类
 from llm import LLM  # 导入语言模型类，可能用于生成报告内容
-from subscription_manager import SubscriptionManager  # 导入订阅管理器类，管理GitHub仓库订阅
 from logger import LOG  # 导入日志记录器
 
-
-def graceful_shutdown(signum, frame):
-    # 优雅关闭程序的函数，处理信号时调用
-    LOG.info("[优雅退出]守护进程接收到终止信号")
-    sys.exit(0)  # 安全退出程序
-
-def github_job(subscription_manager, github_client, report_generator, notifier, days):
+GITHUB_MAX_CONCURRENCY = 8  # GitHub 定时任务中同时处理的最大仓库数量
+
+
+def graceful_shutdown(shutdown_event):
+    # 优雅关闭程序的函数，接收到 SIGTERM 时通知所有定时任务停止
+    # 正在执行的任务会继续运行至完成，避免中途放弃已完成大半的报告
+    LOG.info("[优雅退出]守护进程接收到终止信号，等待正在执行的任务完成")
+    shutdown_event.set()
+
+
+def seconds_until_next_run(exec_time, interval_seconds):
+    """
+    计算距离下一次执行的秒数。
+
+    :param exec_time: 首次执行的时间点，格式为 'HH:MM'。
+    :param interval_seconds: 两次执行之间的间隔秒数。
+    :return: 距离下一次执行的秒数。
+    """
+    if interval_seconds <= 0:
+        # 间隔不为正数时下面的递推无法结束，会永久阻塞事件循环
+        raise ValueError(f"定时任务的执行间隔必须大于 0 秒，当前为：{interval_seconds}（请检查 progress_frequency_days 配置）")
+    now = datetime.now()
+    hour, minute = map(int, exec_time.split(":"))
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    # 以 exec_time 为起点按间隔递推，找到第一个晚于当前时间的执行点
+    while next_run <= now:
+        next_run += timedelta(seconds=interval_seconds)
+    return (next_run - now).total_seconds()
+
+
+async def scheduler(job, interval_seconds, first_at, shutdown_event, *args):
+    """
+    定时执行任务：先休眠到 first_at 指定的时间点，之后每隔 interval_seconds 执行一次。
+    休眠期间收到退出信号时立即返回；任务执行期间收到退出信号时，等待本次任务完成后返回。
+    """
+    while not shutdown_event.is_set():
+        # 按照当前的实际时间计算下一次执行时间，避免执行耗时导致的漂移
+        delay = seconds_until_next_run(first_at, interval_seconds)
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            await job(*args)
+
+
+async def github_job(subscription_manager, github_client, report_generator, notifier, days):
     LOG.info("[开始执行定时任务]GitHub Repo 项目进展报告")
     subscriptions = subscription_manager.list_subscriptions()  # 获取当前所有订阅
     LOG.info(f"订阅列表：{subscriptions}")
-    for repo in subscriptions:
-        # 遍历每个订阅的仓库，执行以下操作
-        markdown_file_path = github_client.export_progress_by_date_range(repo, days)
-        # 从Markdown文件自动生成进展简报
-        report, _ = report_generator.generate_github_report(markdown_file_path)
-        notifier.notify_github_report(repo, report)
+    # 限制同时处理的仓库数量，避免触发 GitHub API 的速率限制
+    semaphore = asyncio.Semaphore(GITHUB_MAX_CONCURRENCY)
+
+    async def process_repo(repo):
+        # 处理单个订阅仓库：导出进展并生成简报
+        async with semaphore:
+            try:
+                markdown_file_path = await asyncio.to_thread(github_client.export_progress_by_date_range, repo, days)
+                # 从Markdown文件自动生成进展简报
+                report, _ = await report_generator.generate_github_report_async(markdown_file_path)
+                return repo, report
+            except Exception as e:
+                # 单个仓库失败不影响其他仓库的处理
+                LOG.error(f"[{repo}]项目进展报告生成失败：{str(e)}")
+                return None
+
+    # 并发处理所有订阅的仓库
+    results = await asyncio.gather(*[asyncio.create_task(process_repo(repo)) for repo in subscriptions])
+    # 汇总所有成功生成的报告，统一发送通知
+    reports = [result for result in results if result is not None]
+    await asyncio.to_thread(notifier.notify_github_reports, reports)
     LOG.info(f"[定时任务执行完毕]")
 
 
-def hn_topic_job(hacker_news_client, report_generator):
+async def hn_topic_job(hacker_news_client, report_generator):
     LOG.info("[开始执行定时任务]Hacker News 热点话题跟踪")
-    markdown_file_path = hacker_news_client.export_top_stories()
-    _, _ = report_generator.generate_hn_topic_report(markdown_file_path)
+    markdown_file_path = await asyncio.to_thread(hacker_news_client.export_top_stories)
+    _, _ = await asyncio.to_thread(report_generator.generate_hn_topic_report, markdown_file_path)
     LOG.info(f"[定时任务执行完毕]")
 
 
-def hn_daily_job(hacker_news_client, report_generator, notifier):
+async def hn_daily_job(hacker_news_client, report_generator, notifier):
     LOG.info("[开始执行定时任务]Hacker News 今日前沿技术趋势")
     # 获取当前日期，并格式化为 'YYYY-MM-DD' 格式
     date = datetime.now().strftime('%Y-%m-%d')
     # 生成每日汇总报告的目录路径
     directory_path = os.path.join('hacker_news', date)
     # 生成每日汇总报告并保存
-    report, _ = report_generator.generate_hn_daily_report(directory_path)
-    notifier.notify_hn_report(date, report)
+    report, _ = await asyncio.to_thread(report_generator.generate_hn_daily_report, directory_path)
+    await asyncio.to_thread(notifier.notify_hn_report, date, report)
     LOG.info(f"[定时任务执行完毕]")
 
 
-def main():
+async def main_async():
     # 设置信号处理器
-    signal.signal(signal.SIGTERM, graceful_shutdown)
+    loop = asyncio.get_running_loop()
+    shutdown_event = asyncio.Event()
+    loop.add_signal_handler(signal.SIGTERM, graceful_shutdown, shutdown_event)
 
     config = Config()  # 创建配置实例
-    github_client = GitHubClient(config.github_token)  # 创建GitHub客户端实例
-    hacker_news_client = HackerNewsClient() # 创建 Hacker News 客户端实例
-    notifier = Notifier(config.email)  # 创建通知器实例
+    tasks = frozenset(task.strip() for task in config.tasks.split(","))  # 需要启用的定时任务
+    notifier = Notifier(config.email, config.notify_per_repo)  # 创建通知器实例
     llm = LLM(config)  # 创建语言模型实例
     report_generator = ReportGenerator(llm, config.report_types)  # 创建报告生成器实例
-    subscription_manager = SubscriptionManager(config.subscriptions_file)  # 创建订阅管理器实例
+    jobs = []
+
+    if "github" in tasks:
+        # 只有启用 GitHub 任务时才导入并创建相关客户端
+        from github_client import GitHubClient  # 导入GitHub客户端类，处理GitHub API请求
+        from subscription_manager import SubscriptionManager  # 导入订阅管理器类，管理GitHub仓库订阅
+        github_client = GitHubClient(config.github_token)  # 创建GitHub客户端实例
+        subscription_manager = SubscriptionManager(config.subscriptions_file)  # 创建订阅管理器实例
+
+        # 启动时立即执行（如不需要可注释）
+        # await github_job(subscription_manager, github_client, report_generator, notifier, config.freq_days)
+
+        # 安排 GitHub 的定时任务
+        jobs.append(scheduler(github_job, config.freq_days * 24 * 3600, config.exec_time, shutdown_event,
+                              subscription_manager, github_client, report_generator, notifier, config.freq_days))
 
-    # 启动时立即执行（如不需要可注释）
-    # github_job(subscription_manager, github_client, report_generator, notifier, config.freq_days)
-    hn_daily_job(hacker_news_client, report_generator, notifier)
+    if "hn" in tasks:
+        # 只有启用 Hacker News 任务时才导入并创建相关客户端
+        from hacker_news_client import HackerNewsClient  # 导入 Hacker News 客户端类
+        hacker_news_client = HackerNewsClient() # 创建 Hacker News 客户端实例
 
-    # 安排 GitHub 的定时任务
-    schedule.every(config.freq_days).days.at(
-        config.exec_time
-    ).do(github_job, subscription_manager, github_client, report_generator, notifier, config.freq_days)
-    
-    # 安排 hn_topic_job 每4小时执行一次，从0点开始
-    schedule.every(4).hours.at(":00").do(hn_topic_job, hacker_news_client, report_generator)
+        # 启动时立即执行（如不需要可注释）
+        await hn_daily_job(hacker_news_client, report_generator, notifier)
 
-    # 安排 hn_daily_job 每天早上10点执行一次
-    schedule.every().day.at("10:00").do(hn_daily_job, hacker_news_client, report_generator, notifier)
+        # 安排 hn_topic_job 每4小时执行一次，从0点开始
+        jobs.append(scheduler(hn_topic_job, 4 * 3600, "00:00", shutdown_event, hacker_news_client, report_generator))
+        # 安排 hn_daily_job 每天早上10点执行一次
+        jobs.append(scheduler(hn_daily_job, 24 * 3600, "10:00", shutdown_event, hacker_news_client, report_generator, notifier))
 
+    if not jobs:
+        LOG.warning(f"未启用任何定时任务，请检查 tasks 配置：{config.tasks}")
+
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        await llm.aclose()  # 释放语言模型的异步连接
+
+
+def main():
     try:
-        # 在守护进程中持续运行
-        while True:
-            schedule.run_pending()
-            time.sleep(1)  # 短暂休眠以减少 CPU 使用
+        # 在守护进程中持续运行，任务之间休眠到下一次执行时间点
+        asyncio.run(main_async())
+        LOG.info("[优雅退出]守护进程已停止")
     except Exception as e:
         LOG.error(f"主进程发生异常: {str(e)}")
         sys.exit(1)
 
 
-
 if __name__ == '__main__':
     main()
@@ -0,0 +1,35 @@
+import os
+import stat
+import tempfile
+
+
+def _target_file_mode(file_path):
+    """
+    获取写入后目标文件应有的权限：目标文件已存在时沿用其原有权限，否则按当前 umask 计算新建文件的权限。
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        # umask 只能通过设置来读取，读取后立即恢复
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_file_atomic(file_path, content):
+    """
+    原子写入文件：先写入同目录下唯一命名的临时文件，再通过 os.replace 替换目标文件。
+    写入过程中进程被中断，或多个进程同时写入同一文件时，目标文件要么保持原样，要么是某次写入的完整内容。
+    """
+    fd, tmp_file_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as file:
+            file.write(content)
+        # mkstemp 创建的临时文件权限为 0600，替换前恢复为目标文件应有的权限
+        os.chmod(tmp_file_path, _target_file_mode(file_path))
+        os.replace(tmp_file_path, file_path)
+    except BaseException:
+        # 写入失败时清理临时文件
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+        raise
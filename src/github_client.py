@@ -4,6 +4,7 @@ import requests  # 导入requests库用于HTTP请求
 from datetime import datetime, date, timedelta  # 导入日期处理模块
 import os  # 导入os模块用于文件和目录操作
 from logger import LOG  # 导入日志模块
+from file_utils import write_file_atomic  # 导入原子写入文件的工具函数
 
 class GitHubClient:
     def __init__(self, token):
@@ -72,11 +73,11 @@ class GitHubClient:
         os.makedirs(repo_dir, exist_ok=True)  # 确保目录存在
         
         file_path = os.path.join(repo_dir, f'{today}.md')  # 构建文件路径
-        with open(file_path, 'w') as file:
-            file.write(f"# Daily Progress for {repo} ({today})\n\n")
-            file.write("\n## Issues Closed Today\n")
-            for issue in updates['issues']:  # 写入今天关闭的问题
-                file.write(f"- {issue['title']} #{issue['number']}\n")
+        content = f"# Daily Progress for {repo} ({today})\n\n"
+        content += "\n## Issues Closed Today\n"
+        for issue in updates['issues']:  # 写入今天关闭的问题
+            content += f"- {issue['title']} #{issue['number']}\n"
+        write_file_atomic(file_path, content)  # 原子写入，避免中断时留下不完整的文件
         
         LOG.info(f"[{repo}]项目每日进展文件生成： {file_path}")  # 记录日志
         return file_path
@@ -94,11 +95,11 @@ class GitHubClient:
         date_str = f"{since}_to_{today}"
         file_path = os.path.join(repo_dir, f'{date_str}.md')  # 构建文件路径
         
-        with open(file_path, 'w') as file:
-            file.write(f"# Progress for {repo} ({since} to {today})\n\n")
-            file.write(f"\n## Issues Closed in the Last {days} Days\n")
-            for issue in updates['issues']:  # 写入在指定日期内关闭的问题
-                file.write(f"- {issue['title']} #{issue['number']}\n")
+        content = f"# Progress for {repo} ({since} to {today})\n\n"
+        content += f"\n## Issues Closed in the Last {days} Days\n"
+        for issue in updates['issues']:  # 写入在指定日期内关闭的问题
+            content += f"- {issue['title']} #{issue['number']}\n"
+        write_file_atomic(file_path, content)  # 原子写入，避免中断时留下不完整的文件
         
         LOG.info(f"[{repo}]项目最新进展文件生成： {file_path}")  # 记录日志
         return file_path
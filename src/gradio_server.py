@@ -13,17 +13,24 @@ config = Config()
 github_client = GitHubClient(config.github_token)
 hacker_news_client = HackerNewsClient() # 创建 Hacker News 客户端实例
 subscription_manager = SubscriptionManager(config.subscriptions_file)
+report_generators = {}  # 按模型类型缓存报告生成器，避免每次请求重复创建 LLM 客户端和加载提示文件
 
-def generate_github_report(model_type, model_name, repo, days):
+def get_report_generator(model_type, model_name):
     config.llm_model_type = model_type
 
+    # 模型名称在生成报告时才从配置中读取，因此同一类型的模型可以共用一个实例
     if model_type == "openai":
         config.openai_model_name = model_name
     else:
         config.ollama_model_name = model_name
 
-    llm = LLM(config)  # 创建语言模型实例
-    report_generator = ReportGenerator(llm, config.report_types)  # 创建报告生成器实例
+    if model_type not in report_generators:
+        llm = LLM(config)  # 创建语言模型实例
+        report_generators[model_type] = ReportGenerator(llm, config.report_types)  # 创建报告生成器实例
+    return report_generators[model_type]
+
+def generate_github_report(model_type, model_name, repo, days):
+    report_generator = get_report_generator(model_type, model_name)  # 获取复用的报告生成器实例
 
     # 定义一个函数，用于导出和生成指定时间范围内项目的进展报告
     raw_file_path = github_client.export_progress_by_date_range(repo, days)  # 导出原始数据文件路径
@@ -32,15 +39,7 @@ def generate_github_report(model_type, model_name, repo, days):
     return report, report_file_path  # 返回报告内容和报告文件路径
 
 def generate_hn_hour_topic(model_type, model_name):
-    config.llm_model_type = model_type
-
-    if model_type == "openai":
-        config.openai_model_name = model_name
-    else:
-        config.ollama_model_name = model_name
-
-    llm = LLM(config)  # 创建语言模型实例
-    report_generator = ReportGenerator(llm, config.report_types)  # 创建报告生成器实例
+    report_generator = get_report_generator(model_type, model_name)  # 获取复用的报告生成器实例
 
     markdown_file_path = hacker_news_client.export_top_stories()
     report, report_file_path = report_generator.generate_hn_topic_report(markdown_file_path)
@@ -1,17 +1,25 @@
 import requests  # 导入requests库用于HTTP请求
-from bs4 import BeautifulSoup  # 导入BeautifulSoup库用于解析HTML内容
+from requests.adapters import HTTPAdapter  # 导入HTTPAdapter用于配置连接池
 from datetime import datetime  # 导入datetime模块用于获取日期和时间
 import os  # 导入os模块用于文件和目录操作
+import time  # 导入time模块用于判断缓存文件是否过期
 from logger import LOG  # 导入日志模块
+from file_utils import write_file_atomic  # 导入原子写入文件的工具函数
 
 class HackerNewsClient:
+    CACHE_TTL_SECONDS = 1800  # 已导出文件的复用有效期（秒）
+
     def __init__(self):
         self.url = 'https://news.ycombinator.com/'  # Hacker News的URL
+        # 复用同一个会话，通过 keep-alive 连接池避免每次请求重新进行 TCP/TLS 握手
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        self.session.headers.update({'User-Agent': 'GitHubSentinel'})
 
     def fetch_top_stories(self):
         LOG.debug("准备获取Hacker News的热门新闻。")
         try:
-            response = requests.get(self.url, timeout=10)
+            response = self.session.get(self.url, timeout=10)
             response.raise_for_status()  # 检查请求是否成功
             top_stories = self.parse_stories(response.text)  # 解析新闻数据
             return top_stories
@@ -21,8 +29,12 @@ class HackerNewsClient:
 
     def parse_stories(self, html_content):
         LOG.debug("解析Hacker News的HTML内容。")
-        soup = BeautifulSoup(html_content, 'html.parser')
-        stories = soup.find_all('tr', class_='athing')  # 查找所有包含新闻的<tr>标签
+        from bs4 import BeautifulSoup, SoupStrainer  # 延迟导入BeautifulSoup库用于解析HTML内容
+        # 只解析包含新闻的<tr class="athing">标签，跳过页面其余部分以减少建树开销
+        # 解析阶段 class 属性尚未拆分，需按空格拆分后匹配，才能命中 class="athing submission"
+        strainer = SoupStrainer('tr', class_=lambda value: value is not None and 'athing' in value.split())
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=strainer)
+        stories = soup.find_all('tr')  # 解析结果中只包含新闻所在的<tr>标签
         
         top_stories = []
         for story in stories:
@@ -37,12 +49,6 @@ class HackerNewsClient:
 
     def export_top_stories(self, date=None, hour=None):
         LOG.debug("准备导出Hacker News的热门新闻。")
-        top_stories = self.fetch_top_stories()  # 获取新闻数据
-        
-        if not top_stories:
-            LOG.warning("未找到任何Hacker News的新闻。")
-            return None
-        
         # 如果未提供 date 和 hour 参数，使用当前日期和时间
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
@@ -51,13 +57,26 @@ class HackerNewsClient:
 
         # 构建存储路径
         dir_path = os.path.join('hacker_news', date)
+        file_path = os.path.join(dir_path, f'{hour}.md')  # 定义文件路径
+
+        # 同一时段的文件刚生成过（例如守护进程重启），直接复用，避免重复抓取
+        if os.path.exists(file_path) and time.time() - os.path.getmtime(file_path) < self.CACHE_TTL_SECONDS:
+            LOG.info(f"Hacker News热门新闻文件已存在，直接复用：{file_path}")
+            return file_path
+
+        top_stories = self.fetch_top_stories()  # 获取新闻数据
+        
+        if not top_stories:
+            LOG.warning("未找到任何Hacker News的新闻。")
+            return None
+
         os.makedirs(dir_path, exist_ok=True)  # 确保目录存在
         
-        file_path = os.path.join(dir_path, f'{hour}.md')  # 定义文件路径
-        with open(file_path, 'w') as file:
-            file.write(f"# Hacker News Top Stories ({date} {hour}:00)\n\n")
-            for idx, story in enumerate(top_stories, start=1):
-                file.write(f"{idx}. [{story['title']}]({story['link']})\n")
+        # 先拼接完整内容，再一次性写入文件
+        header = f"# Hacker News Top Stories ({date} {hour}:00)\n\n"
+        body = "".join(f"{idx}. [{story['title']}]({story['link']})\n" for idx, story in enumerate(top_stories, start=1))
+        # 原子写入，避免中断时留下不完整的文件被后续调用当作缓存复用
+        write_file_atomic(file_path, header + body)
         
         LOG.info(f"Hacker News热门新闻文件生成：{file_path}")
         return file_path
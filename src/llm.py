@@ -1,7 +1,23 @@
 import json
-import requests
-from openai import OpenAI  # 导入OpenAI库用于访问GPT模型
+import random
+import hashlib
+import asyncio
 from logger import LOG  # 导入日志模块
+# openai、requests、httpx 导入开销较大，延迟到首次使用时导入
+
+MAX_RETRIES = 3  # 异步请求的最大重试次数
+REQUEST_TIMEOUT_SECONDS = 300  # 异步请求的超时时间（秒）
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}  # 需要重试的HTTP状态码
+BACKOFF_FACTOR = 1  # 重试退避系数（秒），第 n 次重试前等待 BACKOFF_FACTOR * 2^n 秒
+MAX_BACKOFF_SECONDS = 60  # 单次退避等待的上限（秒）
+CACHE_SIZE_LIMIT = 200 * 1024 * 1024  # 报告缓存占用磁盘空间的上限（字节）
+
+
+def _backoff_delay(attempt):
+    """
+    计算第 attempt 次重试前的等待时间：指数退避并叠加随机抖动，避免并发请求同时重试。
+    """
+    return min(MAX_BACKOFF_SECONDS, BACKOFF_FACTOR * 2 ** attempt) + random.random()
 
 class LLM:
     def __init__(self, config):
@@ -12,7 +28,17 @@ class LLM:
         """
         self.config = config
         self.model = config.llm_model_type.lower()  # 获取模型类型并转换为小写
+        self.async_client = None  # 异步OpenAI客户端，首次异步调用时创建
+        self._http_client = None  # 进程内共享的异步 HTTP 客户端，首次异步调用时创建
+        # 限制同时进行的异步模型调用数量，避免并发过高触发服务端限流
+        if config.max_concurrent_llm < 1:
+            # 上限小于 1 时信号量永远无法获取，所有异步调用会无限等待
+            LOG.error(f"最大并发模型调用数必须大于 0: {config.max_concurrent_llm}")
+            raise ValueError(f"最大并发模型调用数必须大于 0，当前为：{config.max_concurrent_llm}（请检查 max_concurrent_llm 配置）")
+        self._semaphore = asyncio.Semaphore(config.max_concurrent_llm)
+        self._cache = None  # 报告的磁盘缓存，首次使用时创建
         if self.model == "openai":
+            from openai import OpenAI  # 导入OpenAI库用于访问GPT模型
             self.client = OpenAI()  # 创建OpenAI客户端实例
         elif self.model == "ollama":
             self.api_url = config.ollama_api_url  # 设置Ollama API的URL
@@ -28,19 +54,69 @@ class LLM:
         :param user_content: 用户提供的内容，通常是Markdown格式的文本。
         :return: 生成的报告内容。
         """
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_content},
-        ]
+        messages = self._build_messages(system_prompt, user_content)
+
+        # 相同的提示和内容已经生成过报告时，直接返回缓存结果
+        cache_key = self._cache_key(messages)
+        cached_report = self._get_cached_report(cache_key)
+        if cached_report is not None:
+            return cached_report
 
         # 根据选择的模型调用相应的生成报告方法
         if self.model == "openai":
-            return self._generate_report_openai(messages)
+            report = self._generate_report_openai(messages)
         elif self.model == "ollama":
-            return self._generate_report_ollama(messages)
+            report = self._generate_report_ollama(messages)
         else:
             raise ValueError(f"不支持的模型类型: {self.model}")
 
+        self._set_cached_report(cache_key, report)
+        return report
+
+    def _build_messages(self, system_prompt, user_content):
+        """
+        构建发送给模型的消息列表。
+        """
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ]
+
+    def _cache_key(self, messages):
+        """
+        根据模型类型、模型名称和消息内容计算缓存键。
+        """
+        model_name = self.config.openai_model_name if self.model == "openai" else self.config.ollama_model_name
+        raw_key = self.model + model_name + json.dumps(messages, ensure_ascii=False)
+        return hashlib.blake2b(raw_key.encode('utf-8')).hexdigest()
+
+    def _get_cached_report(self, cache_key):
+        """
+        从磁盘缓存中读取报告，未启用缓存或未命中时返回 None。
+        """
+        if not self.config.llm_cache_enabled:
+            return None
+        report = self._get_cache().get(cache_key)
+        if report is not None:
+            LOG.info("命中报告缓存，跳过模型调用。")
+        return report
+
+    def _set_cached_report(self, cache_key, report):
+        """
+        将生成的报告写入磁盘缓存。
+        """
+        if self.config.llm_cache_enabled:
+            self._get_cache().set(cache_key, report, expire=self.config.llm_cache_expire_seconds)
+
+    def _get_cache(self):
+        """
+        获取报告的磁盘缓存，延迟到首次使用时创建。
+        """
+        if self._cache is None:
+            import diskcache  # 导入diskcache库用于持久化缓存
+            self._cache = diskcache.Cache(self.config.llm_cache_dir, size_limit=CACHE_SIZE_LIMIT)
+        return self._cache
+
     def _generate_report_openai(self, messages):
         """
         使用 OpenAI GPT 模型生成报告。
@@ -77,6 +153,7 @@ class LLM:
                 "stream": False
             }
 
+            import requests  # 导入requests库用于HTTP请求
             response = requests.post(self.api_url, json=payload)  # 发送POST请求到Ollama API
             response_data = response.json()
 
@@ -94,6 +171,147 @@ class LLM:
             LOG.error(f"生成报告时发生错误：{e}")
             raise
 
+    async def generate_report_async(self, system_prompt, user_content):
+        """
+        异步生成报告，允许多个请求同时等待模型响应。
+
+        :param system_prompt: 系统提示信息，包含上下文和规则。
+        :param user_content: 用户提供的内容，通常是Markdown格式的文本。
+        :return: 生成的报告内容。
+        """
+        # 相同的提示和内容已经生成过报告时，直接返回缓存结果
+        cache_key = self._cache_key(self._build_messages(system_prompt, user_content))
+        cached_report = self._get_cached_report(cache_key)
+        if cached_report is not None:
+            return cached_report
+
+        chunks = [chunk async for chunk in self.stream_report_async(system_prompt, user_content)]
+        report = "".join(chunks)
+        LOG.debug("模型流式响应拼接结果: {}", report)
+
+        self._set_cached_report(cache_key, report)
+        return report
+
+    async def stream_report_async(self, system_prompt, user_content):
+        """
+        以流式方式异步生成报告，模型每返回一段内容就立即产出，无需等待完整响应。
+
+        :param system_prompt: 系统提示信息，包含上下文和规则。
+        :param user_content: 用户提供的内容，通常是Markdown格式的文本。
+        :return: 逐段产出报告内容的异步迭代器。
+        """
+        messages = self._build_messages(system_prompt, user_content)
+
+        # 根据选择的模型调用相应的生成报告方法
+        if self.model == "openai":
+            stream = self._stream_report_openai_async(messages)
+        elif self.model == "ollama":
+            stream = self._stream_report_ollama_async(messages)
+        else:
+            raise ValueError(f"不支持的模型类型: {self.model}")
+        async with self._semaphore:
+            async for chunk in stream:
+                yield chunk
+
+    async def _stream_report_openai_async(self, messages):
+        """
+        使用 OpenAI GPT 模型以流式方式异步生成报告。
+
+        :param messages: 包含系统提示和用户内容的消息列表。
+        :return: 逐段产出报告内容的异步迭代器。
+        """
+        LOG.info(f"使用 OpenAI {self.config.openai_model_name} 模型异步生成报告。")
+        if self.async_client is None:
+            from openai import AsyncOpenAI  # 导入OpenAI异步客户端
+            # 创建异步OpenAI客户端实例，复用共享的 HTTP/2 连接
+            self.async_client = AsyncOpenAI(http_client=self._get_async_http_client())
+        try:
+            stream = await self.async_client.chat.completions.create(
+                model=self.config.openai_model_name,  # 使用配置中的OpenAI模型名称
+                messages=messages,
+                stream=True
+            )
+            async for chunk in stream:
+                # 最后一个分片可能不包含 choices 或 content
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            LOG.error(f"生成报告时发生错误：{e}")
+            raise
+
+    async def _stream_report_ollama_async(self, messages):
+        """
+        使用 Ollama LLaMA 模型以流式方式异步生成报告。
+        Ollama 的流式响应为逐行的 JSON 对象，最后一行带有 "done": true。
+
+        :param messages: 包含系统提示和用户内容的消息列表。
+        :return: 逐段产出报告内容的异步迭代器。
+        """
+        LOG.info(f"使用 Ollama {self.config.ollama_model_name} 模型异步生成报告。")
+        try:
+            payload = {
+                "model": self.config.ollama_model_name,  # 使用配置中的Ollama模型名称
+                "messages": messages,
+                "max_tokens": 4000,
+                "temperature": 0.7,
+                "stream": True
+            }
+
+            client = self._get_async_http_client()
+            for attempt in range(MAX_RETRIES + 1):
+                async with client.stream("POST", self.api_url, json=payload) as response:  # 发送POST请求到Ollama API
+                    if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                        if not 200 <= response.status_code < 300:
+                            # 非成功状态码时响应体是错误信息，保留状态码和服务端返回的内容
+                            await response.aread()
+                            raise RuntimeError(f"Ollama API 返回错误状态码 {response.status_code}：{response.text}")
+                        received = False
+                        async for line in response.aiter_lines():
+                            if not line:
+                                continue
+                            data = json.loads(line)
+                            # 从每行数据中获取本次分片的 content
+                            content = data.get("message", {}).get("content", None)
+                            if content:
+                                received = True
+                                yield content
+                            if data.get("done"):
+                                break
+                        if not received:
+                            LOG.error("无法从响应中提取报告内容。")
+                            raise ValueError("Ollama API 返回的响应结构无效")
+                        return
+                LOG.warning(f"Ollama API 返回状态码 {response.status_code}，准备第 {attempt + 1} 次重试")
+                await asyncio.sleep(_backoff_delay(attempt))
+        except Exception as e:
+            LOG.error(f"生成报告时发生错误：{e}")
+            raise
+
+    def _get_async_http_client(self):
+        """
+        获取共享的异步 HTTP 客户端。启用 HTTP/2 后，并发请求可以复用同一个连接。
+        transport 层的 retries 负责连接失败的重试，429/5xx 的重试由调用方处理。
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            import httpx  # 导入httpx库用于异步HTTP请求，支持HTTP/2
+            self._http_client = httpx.AsyncClient(
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT_SECONDS,
+                transport=httpx.AsyncHTTPTransport(http2=True, retries=MAX_RETRIES)
+            )
+        return self._http_client
+
+    async def aclose(self):
+        """
+        关闭异步调用所持有的网络连接。
+        """
+        if self.async_client is not None:
+            await self.async_client.close()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        if self._cache is not None:
+            self._cache.close()
+
 if __name__ == '__main__':
     from config import Config  # 导入配置管理类
     config = Config()
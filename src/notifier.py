@@ -5,8 +5,9 @@ from email.mime.multipart import MIMEMultipart
 from logger import LOG
 
 class Notifier:
-    def __init__(self, email_settings):
+    def __init__(self, email_settings, notify_per_repo=False):
         self.email_settings = email_settings
+        self.notify_per_repo = notify_per_repo  # 为 True 时每个仓库单独发送一封邮件
     
     def notify_github_report(self, repo, report):
         """
@@ -20,6 +21,28 @@ class Notifier:
         else:
             LOG.warning("邮件设置未配置正确，无法发送 GitHub 报告通知")
     
+    def notify_github_reports(self, reports):
+        """
+        将多个 GitHub 项目报告合并为一封邮件发送，只需建立一次 SMTP 连接
+        :param reports: (仓库名称, 报告内容) 组成的列表
+        """
+        if not reports:
+            LOG.info("没有需要发送的 GitHub 报告")
+            return
+        if self.notify_per_repo:
+            for repo, report in reports:
+                self.notify_github_report(repo, report)
+            return
+        if self.email_settings:
+            repos = [repo for repo, _ in reports]
+            subject = f"[GitHub] {len(repos)} 个项目进展简报"
+            # 在邮件开头列出目录，随后依次附上各项目的报告
+            toc = "\n".join(f"- {repo}" for repo in repos)
+            sections = "\n\n---\n\n".join(report for _, report in reports)
+            self.send_email(subject, f"# GitHub 项目进展简报\n\n## 目录\n\n{toc}\n\n---\n\n{sections}")
+        else:
+            LOG.warning("邮件设置未配置正确，无法发送 GitHub 报告通知")
+    
     def notify_hn_report(self, date, report):
         """
         发送 Hacker News 每日技术趋势报告邮件
@@ -1,5 +1,17 @@
 import os
+import functools
+import pathlib
 from logger import LOG  # 导入日志模块
+from file_utils import write_file_atomic  # 导入原子写入文件的工具函数
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt(prompt_file):
+    """
+    读取提示文件内容。结果按路径缓存，重复创建 ReportGenerator 时无需再次读取磁盘。
+    """
+    return pathlib.Path(prompt_file).read_text(encoding='utf-8')
+
 
 class ReportGenerator:
     def __init__(self, llm, report_types):
@@ -17,8 +29,7 @@ class ReportGenerator:
             if not os.path.exists(prompt_file):
                 LOG.error(f"提示文件不存在: {prompt_file}")
                 raise FileNotFoundError(f"提示文件未找到: {prompt_file}")
-            with open(prompt_file, "r", encoding='utf-8') as file:
-                self.prompts[report_type] = file.read()
+            self.prompts[report_type] = _load_prompt(prompt_file)
 
     def generate_github_report(self, markdown_file_path):
         """
@@ -31,8 +42,23 @@ class ReportGenerator:
         report = self.llm.generate_report(system_prompt, markdown_content)
         
         report_file_path = os.path.splitext(markdown_file_path)[0] + "_report.md"
-        with open(report_file_path, 'w+') as report_file:
-            report_file.write(report)
+        write_file_atomic(report_file_path, report)
+
+        LOG.info(f"GitHub 项目报告已保存到 {report_file_path}")
+        return report, report_file_path
+
+    async def generate_github_report_async(self, markdown_file_path):
+        """
+        异步生成 GitHub 项目的报告，并保存为 {original_filename}_report.md。
+        """
+        with open(markdown_file_path, 'r') as file:
+            markdown_content = file.read()
+
+        system_prompt = self.prompts.get("github")
+        report = await self.llm.generate_report_async(system_prompt, markdown_content)
+        
+        report_file_path = os.path.splitext(markdown_file_path)[0] + "_report.md"
+        write_file_atomic(report_file_path, report)
 
         LOG.info(f"GitHub 项目报告已保存到 {report_file_path}")
         return report, report_file_path
@@ -48,8 +74,7 @@ class ReportGenerator:
         report = self.llm.generate_report(system_prompt, markdown_content)
         
         report_file_path = os.path.splitext(markdown_file_path)[0] + "_topic.md"
-        with open(report_file_path, 'w+') as report_file:
-            report_file.write(report)
+        write_file_atomic(report_file_path, report)
 
         LOG.info(f"Hacker News 热点主题报告已保存到 {report_file_path}")
         return report, report_file_path
@@ -70,8 +95,7 @@ class ReportGenerator:
         
         report = self.llm.generate_report(system_prompt, markdown_content)
         
-        with open(report_file_path, 'w+') as report_file:
-            report_file.write(report)
+        write_file_atomic(report_file_path, report)
         
         LOG.info(f"Hacker News 每日汇总报告已保存到 {report_file_path}")
         return report, report_file_path
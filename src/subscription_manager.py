@@ -1,4 +1,7 @@
 import json
+import os
+from logger import LOG  # 导入日志模块
+from file_utils import write_file_atomic  # 导入原子写入文件的工具函数
 
 class SubscriptionManager:
     def __init__(self, subscriptions_file):
@@ -6,14 +9,25 @@ class SubscriptionManager:
         self.subscriptions = self.load_subscriptions()
     
     def load_subscriptions(self):
+        # 记录读取时文件的修改时间，用于判断文件是否被外部修改
+        self._mtime = self._get_mtime()
         with open(self.subscriptions_file, 'r') as f:
             return json.load(f)
     
     def save_subscriptions(self):
-        with open(self.subscriptions_file, 'w') as f:
-            json.dump(self.subscriptions, f, indent=4)
+        # 原子写入，避免守护进程读取到写了一半的订阅文件
+        write_file_atomic(self.subscriptions_file, json.dumps(self.subscriptions, indent=4))
+        self._mtime = self._get_mtime()
     
     def list_subscriptions(self):
+        # 仅当订阅文件在外部被修改后才重新解析，否则直接返回内存中的订阅列表
+        mtime = self._get_mtime()
+        if mtime is not None and mtime != self._mtime:
+            try:
+                self.subscriptions = self.load_subscriptions()
+            except (OSError, json.JSONDecodeError) as e:
+                # 文件无法读取或内容不完整时，继续使用内存中已有的订阅列表
+                LOG.error(f"重新加载订阅文件失败，继续使用已有的订阅列表：{str(e)}")
         return self.subscriptions
     
     def add_subscription(self, repo):
@@ -24,4 +38,11 @@ class SubscriptionManager:
     def remove_subscription(self, repo):
         if repo in self.subscriptions:
             self.subscriptions.remove(repo)
-            self.save_subscriptions()
\ No newline at end of file
+            self.save_subscriptions()
+
+    def _get_mtime(self):
+        # 获取订阅文件的修改时间，文件不存在时返回 None
+        try:
+            return os.stat(self.subscriptions_file).st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,181 @@
+import sys
+import os
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import patch, AsyncMock, MagicMock
+
+# 添加 src 目录到模块搜索路径，以便可以导入 src 目录中的模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import daemon_process  # 导入 daemon_process 模块以访问定时任务函数
+from daemon_process import seconds_until_next_run, scheduler, github_job, main_async  # 导入要测试的调度函数和定时任务
+
+
+class FixedDatetime(datetime):
+    """
+    固定当前时间为 2024-09-01 09:30:00，便于验证下一次执行时间的计算。
+    """
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 9, 1, 9, 30, 0)
+
+
+@patch('daemon_process.datetime', FixedDatetime)
+class TestDaemonProcess(unittest.TestCase):
+    def test_next_run_later_today(self):
+        """
+        测试执行时间点在今天稍后时，返回距离该时间点的秒数。
+        """
+        self.assertEqual(seconds_until_next_run("10:00", 24 * 3600), 30 * 60)
+
+    def test_next_run_tomorrow(self):
+        """
+        测试今天的执行时间点已过时，顺延到明天的同一时间点。
+        """
+        self.assertEqual(seconds_until_next_run("08:00", 24 * 3600), 22.5 * 3600)
+
+    def test_next_run_every_four_hours_from_midnight(self):
+        """
+        测试以 00:00 为起点每 4 小时执行一次时，09:30 之后的下一次执行时间为 12:00。
+        """
+        self.assertEqual(seconds_until_next_run("00:00", 4 * 3600), 2.5 * 3600)
+
+    def test_non_positive_interval_raises(self):
+        """
+        测试执行间隔不为正数时抛出错误，而不是陷入死循环。
+        """
+        with self.assertRaises(ValueError):
+            seconds_until_next_run("08:00", 0)
+        with self.assertRaises(ValueError):
+            seconds_until_next_run("08:00", -24 * 3600)
+
+    def test_scheduler_returns_on_shutdown_during_wait(self):
+        """
+        测试调度器在等待下一次执行期间收到退出信号时立即返回，且不执行任务。
+        """
+        job = AsyncMock()
+
+        async def run():
+            shutdown_event = asyncio.Event()
+            scheduler_task = asyncio.create_task(scheduler(job, 24 * 3600, "10:00", shutdown_event))
+            await asyncio.sleep(0)  # 让调度器进入等待状态
+            shutdown_event.set()
+            await asyncio.wait_for(scheduler_task, timeout=1)
+
+        asyncio.run(run())
+        job.assert_not_awaited()
+
+
+class TestGithubJob(unittest.TestCase):
+    def test_failed_repo_does_not_abort_batch(self):
+        """
+        测试单个仓库失败时其余仓库照常处理，并按订阅顺序汇总成功的报告统一发送一次通知。
+        """
+        subscriptions = ["owner/repo1", "owner/broken", "owner/repo3"]
+        subscription_manager = MagicMock()
+        subscription_manager.list_subscriptions.return_value = subscriptions
+
+        def export_progress(repo, days):
+            if repo == "owner/broken":
+                raise RuntimeError("GitHub API error")
+            return f"{repo}.md"
+
+        github_client = MagicMock()
+        github_client.export_progress_by_date_range.side_effect = export_progress
+
+        report_generator = MagicMock()
+
+        async def generate_report(markdown_file_path):
+            # 让先订阅的仓库更晚完成，验证汇总结果仍按订阅顺序排列
+            if markdown_file_path == "owner/repo1.md":
+                await asyncio.sleep(0.01)
+            return f"report for {markdown_file_path}", f"{markdown_file_path}_report.md"
+
+        report_generator.generate_github_report_async.side_effect = generate_report
+        notifier = MagicMock()
+
+        asyncio.run(github_job(subscription_manager, github_client, report_generator, notifier, 1))
+
+        self.assertEqual(github_client.export_progress_by_date_range.call_count, 3)
+        notifier.notify_github_reports.assert_called_once_with([
+            ("owner/repo1", "report for owner/repo1.md"),
+            ("owner/repo3", "report for owner/repo3.md"),
+        ])
+
+class TestMainAsync(unittest.TestCase):
+    def run_main_async(self, tasks):
+        """
+        以指定的 tasks 配置运行 main_async，返回被安排的定时任务函数列表和模拟的客户端类。
+        """
+        config = MagicMock()
+        config.tasks = tasks
+        llm = MagicMock()
+        llm.aclose = AsyncMock()
+
+        with patch('daemon_process.Config', return_value=config), \
+             patch('daemon_process.LLM', return_value=llm), \
+             patch('daemon_process.Notifier'), \
+             patch('daemon_process.ReportGenerator'), \
+             patch('daemon_process.scheduler', new_callable=AsyncMock) as mock_scheduler, \
+             patch('daemon_process.hn_daily_job', new_callable=AsyncMock) as mock_hn_daily_job, \
+             patch('daemon_process.LOG') as mock_log, \
+             patch('github_client.GitHubClient') as mock_github_client, \
+             patch('subscription_manager.SubscriptionManager'), \
+             patch('hacker_news_client.HackerNewsClient') as mock_hn_client:
+            asyncio.run(main_async())
+
+        # 启用 Hacker News 任务时，启动时会立即执行一次每日汇总任务
+        self.assertEqual(mock_hn_daily_job.await_count, 1 if mock_hn_client.called else 0)
+        self.mock_hn_daily_job = mock_hn_daily_job
+        llm.aclose.assert_awaited_once()
+        scheduled_jobs = [call.args[0] for call in mock_scheduler.call_args_list]
+        return scheduled_jobs, mock_github_client, mock_hn_client, mock_log
+
+    def test_github_only(self):
+        """
+        测试只启用 GitHub 任务时，仅创建 GitHub 客户端并安排 GitHub 定时任务。
+        """
+        scheduled_jobs, mock_github_client, mock_hn_client, _ = self.run_main_async("github")
+        self.assertEqual(scheduled_jobs, [daemon_process.github_job])
+        mock_github_client.assert_called_once()
+        mock_hn_client.assert_not_called()
+
+    def test_hn_only(self):
+        """
+        测试只启用 Hacker News 任务时，仅创建 Hacker News 客户端并安排两个 Hacker News 定时任务。
+        """
+        scheduled_jobs, mock_github_client, mock_hn_client, _ = self.run_main_async("hn")
+        self.assertEqual(scheduled_jobs, [daemon_process.hn_topic_job, self.mock_hn_daily_job])
+        mock_github_client.assert_not_called()
+        mock_hn_client.assert_called_once()
+
+    def test_tasks_with_whitespace(self):
+        """
+        测试任务名两侧的空白会被忽略，同时启用 GitHub 和 Hacker News 任务。
+        """
+        scheduled_jobs, _, _, _ = self.run_main_async(" github , hn ")
+        self.assertEqual(scheduled_jobs,
+                         [daemon_process.github_job, daemon_process.hn_topic_job, self.mock_hn_daily_job])
+
+    def test_task_names_match_exactly(self):
+        """
+        测试任务名需要完全匹配，"github-foo" 不会启用 GitHub 任务。
+        """
+        scheduled_jobs, mock_github_client, _, mock_log = self.run_main_async("github-foo")
+        self.assertEqual(scheduled_jobs, [])
+        mock_github_client.assert_not_called()
+        mock_log.warning.assert_called_once()
+
+    def test_no_tasks(self):
+        """
+        测试未启用任何任务时记录警告并直接返回。
+        """
+        scheduled_jobs, mock_github_client, mock_hn_client, mock_log = self.run_main_async("")
+        self.assertEqual(scheduled_jobs, [])
+        mock_github_client.assert_not_called()
+        mock_hn_client.assert_not_called()
+        mock_log.warning.assert_called_once_with("未启用任何定时任务，请检查 tasks 配置：")
+
+if __name__ == '__main__':
+    unittest.main()
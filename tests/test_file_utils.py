@@ -0,0 +1,89 @@
+import sys
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 添加 src 目录到模块搜索路径，以便可以导入 src 目录中的模块
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from file_utils import write_file_atomic  # 导入要测试的原子写入函数
+
+class TestFileUtils(unittest.TestCase):
+    def setUp(self):
+        """
+        在每个测试方法之前运行，创建临时目录和已有内容的目标文件。
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, 'report.md')
+        with open(self.file_path, 'w') as file:
+            file.write("old content")
+
+    def tearDown(self):
+        """
+        在每个测试方法之后运行，清理临时目录。
+        """
+        self.tmp_dir.cleanup()
+
+    def test_write_file_atomic(self):
+        """
+        测试 write_file_atomic 方法是否正确替换文件内容，并且不留下临时文件。
+        """
+        write_file_atomic(self.file_path, "new content")
+
+        with open(self.file_path, 'r') as file:
+            self.assertEqual(file.read(), "new content")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ['report.md'])
+
+    @patch('file_utils.os.replace')
+    def test_write_file_atomic_unique_tmp_file(self, mock_replace):
+        """
+        测试每次写入都使用同目录下唯一命名的临时文件，避免并发写入同一文件时互相覆盖临时文件。
+        """
+        write_file_atomic(self.file_path, "first content")
+        write_file_atomic(self.file_path, "second content")
+
+        first_tmp_path = mock_replace.call_args_list[0].args[0]
+        second_tmp_path = mock_replace.call_args_list[1].args[0]
+        self.assertNotEqual(first_tmp_path, second_tmp_path)
+        self.assertEqual(os.path.dirname(first_tmp_path), self.tmp_dir.name)
+        self.assertEqual(os.path.dirname(second_tmp_path), self.tmp_dir.name)
+
+    @patch('file_utils.os.replace', side_effect=KeyboardInterrupt)
+    def test_write_file_atomic_interrupted(self, mock_replace):
+        """
+        测试写入过程中被中断时，原文件保持不变，并且临时文件被清理。
+        """
+        with self.assertRaises(KeyboardInterrupt):
+            write_file_atomic(self.file_path, "new content")
+
+        with open(self.file_path, 'r') as file:
+            self.assertEqual(file.read(), "old content")
+        self.assertEqual(os.listdir(self.tmp_dir.name), ['report.md'])
+
+    def test_write_file_atomic_keeps_existing_mode(self):
+        """
+        测试替换已有文件时保留其原有权限，不会把仅本人可读的文件变为所有人可读。
+        """
+        os.chmod(self.file_path, 0o600)
+
+        write_file_atomic(self.file_path, "new content")
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.file_path).st_mode), 0o600)
+
+    def test_write_file_atomic_new_file_respects_umask(self):
+        """
+        测试新建文件时按照当前进程的 umask 设置权限。
+        """
+        new_file_path = os.path.join(self.tmp_dir.name, 'new_report.md')
+        old_umask = os.umask(0o077)
+        try:
+            write_file_atomic(new_file_path, "new content")
+        finally:
+            os.umask(old_umask)
+
+        self.assertEqual(stat.S_IMODE(os.stat(new_file_path).st_mode), 0o600)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import time
 from io import StringIO
 
 # 添加 src 目录到模块搜索路径，以便可以导入 src 目录中的模块
@@ -15,7 +16,7 @@ class TestHackerNewsClient(unittest.TestCase):
     def setUp(self):
         self.client = HackerNewsClient()
 
-    @patch('hacker_news_client.requests.get')
+    @patch('hacker_news_client.requests.Session.get')
     def test_fetch_top_stories_success(self, mock_get):
         # 模拟HTTP响应
         mock_response = MagicMock()
@@ -37,7 +38,23 @@ class TestHackerNewsClient(unittest.TestCase):
         self.assertEqual(top_stories[0]['title'], 'Story 1')
         self.assertEqual(top_stories[0]['link'], 'https://news.ycombinator.com/')
     
-    @patch('hacker_news_client.requests.get')
+    def test_parse_stories_only_athing_rows(self):
+        # 验证只解析 athing 行，并支持包含多个 class 的行
+        html_content = '''
+        <html><body><table>
+        <tr class="athing submission">
+            <td class="title"><span class="titleline"><a href="https://example.com/1">Story 1</a></span></td>
+        </tr>
+        <tr><td class="subtext"><span class="titleline"><a href="item?id=1">comments</a></span></td></tr>
+        <tr class="athing">
+            <td class="title"><span class="titleline"><a href="https://example.com/2">Story 2</a></span></td>
+        </tr>
+        </table></body></html>
+        '''
+        top_stories = self.client.parse_stories(html_content)
+        self.assertEqual([story['title'] for story in top_stories], ['Story 1', 'Story 2'])
+
+    @patch('hacker_news_client.requests.Session.get')
     def test_fetch_top_stories_failure(self, mock_get):
         # 模拟HTTP请求失败
         mock_get.side_effect = Exception("Connection error")
@@ -47,10 +64,10 @@ class TestHackerNewsClient(unittest.TestCase):
         self.assertEqual(top_stories, [])
 
     
-    @patch('hacker_news_client.requests.get')
+    @patch('hacker_news_client.requests.Session.get')
     @patch('hacker_news_client.os.makedirs')
-    @patch('hacker_news_client.open', new_callable=unittest.mock.mock_open)
-    def test_export_top_stories(self, mock_open, mock_makedirs, mock_get):
+    @patch('hacker_news_client.write_file_atomic')
+    def test_export_top_stories(self, mock_write, mock_makedirs, mock_get):
         # 模拟HTTP响应
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -70,16 +87,18 @@ class TestHackerNewsClient(unittest.TestCase):
         
         # 验证目录和文件创建
         mock_makedirs.assert_called_once_with('hacker_news/2024-09-01', exist_ok=True)
-        mock_open.assert_called_once_with('hacker_news/2024-09-01/14.md', 'w')
         
-        # 验证文件内容
-        mock_open().write.assert_any_call("# Hacker News Top Stories (2024-09-01 14:00)\n\n")
-        mock_open().write.assert_any_call("1. [Story 1](https://news.ycombinator.com/)\n")
+        # 验证文件路径和内容
+        mock_write.assert_called_once_with(
+            'hacker_news/2024-09-01/14.md',
+            "# Hacker News Top Stories (2024-09-01 14:00)\n\n"
+            "1. [Story 1](https://news.ycombinator.com/)\n"
+        )
 
-    @patch('hacker_news_client.requests.get')
+    @patch('hacker_news_client.requests.Session.get')
     @patch('hacker_news_client.os.makedirs')
-    @patch('hacker_news_client.open', new_callable=unittest.mock.mock_open)
-    def test_export_top_stories_no_stories(self, mock_open, mock_makedirs, mock_get):
+    @patch('hacker_news_client.write_file_atomic')
+    def test_export_top_stories_no_stories(self, mock_write, mock_makedirs, mock_get):
         # 模拟HTTP响应为空
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -91,8 +110,22 @@ class TestHackerNewsClient(unittest.TestCase):
         
         # 验证没有创建文件
         mock_makedirs.assert_not_called()
-        mock_open.assert_not_called()
+        mock_write.assert_not_called()
         self.assertIsNone(file_path)
 
+    @patch('hacker_news_client.requests.Session.get')
+    @patch('hacker_news_client.os.path.getmtime')
+    @patch('hacker_news_client.os.path.exists', return_value=True)
+    def test_export_top_stories_reuses_recent_file(self, mock_exists, mock_getmtime, mock_get):
+        # 模拟同一时段的文件刚刚生成过
+        mock_getmtime.return_value = time.time()
+
+        # 调用方法
+        file_path = self.client.export_top_stories(date="2024-09-01", hour="14")
+
+        # 验证直接复用已有文件，没有重新抓取
+        self.assertEqual(file_path, 'hacker_news/2024-09-01/14.md')
+        mock_get.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,12 +1,17 @@
 import sys
 import os
+import asyncio
+import json
+import tempfile
 import unittest
+import httpx
 from unittest.mock import patch, MagicMock
 
 # 将 src 目录添加到模块搜索路径，方便导入项目中的模块
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from config import Config  # 导入配置类
+import llm as llm_module  # 导入 llm 模块以访问重试相关的常量
 from llm import LLM  # 导入要测试的 LLM 类
 
 class TestLLM(unittest.TestCase):
@@ -15,6 +20,7 @@ class TestLLM(unittest.TestCase):
         在每个测试方法运行前执行，初始化 LLM 实例和测试数据。
         """
         self.config = Config()  # 初始化配置对象
+        self.config.llm_cache_enabled = False  # 测试中关闭报告缓存，确保每次都走模型调用路径
         self.llm = LLM(self.config)  # 使用配置对象初始化 LLM 实例
 
         # 设置示例的系统提示信息
@@ -40,7 +46,17 @@ class TestLLM(unittest.TestCase):
             llm = LLM(self.config)
         mock_log_error.assert_called_with("不支持的模型类型: invalid_model")
 
-    @patch('llm.requests.post')
+    @patch('llm.LOG.error')
+    def test_invalid_max_concurrent_llm(self, mock_log_error):
+        """
+        测试最大并发模型调用数小于 1 时抛出错误，而不是让异步调用无限等待。
+        """
+        self.config.max_concurrent_llm = 0
+        with self.assertRaises(ValueError):
+            LLM(self.config)
+        mock_log_error.assert_called_with("最大并发模型调用数必须大于 0: 0")
+
+    @patch('requests.post')
     @patch('llm.LOG.error')
     def test_ollama_invalid_response_structure(self, mock_log_error, mock_post):
         """
@@ -56,8 +72,175 @@ class TestLLM(unittest.TestCase):
         mock_log_error.assert_called_with("生成报告时发生错误：Ollama API 返回的响应结构无效")
 
 
+    def _mock_ollama_stream(self, lines):
+        """
+        构造一个模拟的异步 HTTP 客户端，其流式响应逐行返回给定的 JSON 数据。
+        """
+        async def aiter_lines():
+            for line in lines:
+                yield json.dumps(line)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.aiter_lines = aiter_lines
+        mock_client = MagicMock()
+        mock_client.stream.return_value.__aenter__.return_value = mock_response
+        return mock_client
+
+    def test_ollama_async_stream_concatenates_chunks(self):
+        """
+        测试异步调用 Ollama API 时是否正确拼接流式返回的内容。
+        """
+        mock_client = self._mock_ollama_stream([
+            {"message": {"content": "Hello, "}, "done": False},
+            {"message": {"content": "world"}, "done": False},
+            {"message": {"content": ""}, "done": True},
+        ])
+
+        with patch.object(self.llm, '_get_async_http_client', return_value=mock_client):
+            report = asyncio.run(self.llm.generate_report_async(self.system_prompt, self.github_content))
+        self.assertEqual(report, "Hello, world")
+
+    @patch('llm.LOG.error')
+    def test_ollama_async_invalid_response_structure(self, mock_log_error):
+        """
+        测试异步调用 Ollama API 返回的响应结构无效时的错误处理路径。
+        """
+        # 模拟异步 HTTP 客户端返回的无效响应
+        mock_client = self._mock_ollama_stream([{"invalid_key": "no_content_here"}])
+
+        with patch.object(self.llm, '_get_async_http_client', return_value=mock_client):
+            with self.assertRaises(ValueError):
+                asyncio.run(self.llm.generate_report_async(self.system_prompt, self.github_content))
+        mock_log_error.assert_called_with("生成报告时发生错误：Ollama API 返回的响应结构无效")
+
+    def _mock_ollama_transport(self, handler):
+        """
+        构造一个使用 httpx.MockTransport 的异步 HTTP 客户端，由 handler 返回模拟响应。
+        """
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @patch('llm.LOG.error')
+    def test_ollama_async_error_status(self, mock_log_error):
+        """
+        测试 Ollama API 返回非成功状态码时，错误信息保留状态码和服务端返回的内容。
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, text="rate limited")
+            return httpx.Response(404, json={"error": "model 'llama3.1' not found"})
+
+        with patch('llm._backoff_delay', return_value=0):
+            with patch.object(self.llm, '_get_async_http_client', return_value=self._mock_ollama_transport(handler)):
+                with self.assertRaises(RuntimeError) as context:
+                    asyncio.run(self.llm.generate_report_async(self.system_prompt, self.github_content))
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("404", str(context.exception))
+        self.assertIn("model 'llama3.1' not found", str(context.exception))
+
+    def test_ollama_async_retries_rate_limited_request(self):
+        """
+        测试 Ollama API 返回 429 后是否按退避策略重试，并返回重试成功后的内容。
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, text="rate limited")
+            return httpx.Response(200, text=json.dumps({"message": {"content": "Retried report"}, "done": True}))
+
+        with patch('llm._backoff_delay', return_value=0) as mock_backoff:
+            with patch.object(self.llm, '_get_async_http_client', return_value=self._mock_ollama_transport(handler)):
+                report = asyncio.run(self.llm.generate_report_async(self.system_prompt, self.github_content))
+
+        self.assertEqual(report, "Retried report")
+        self.assertEqual(len(calls), 2)
+        mock_backoff.assert_called_once_with(0)
+
+    @patch('llm.LOG.error')
+    def test_ollama_async_stops_after_max_retries(self, mock_log_error):
+        """
+        测试 Ollama API 持续返回 429 时，是否在 MAX_RETRIES + 1 次请求后停止重试并抛出错误。
+        """
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, text="rate limited")
+
+        with patch('llm._backoff_delay', return_value=0):
+            with patch.object(self.llm, '_get_async_http_client', return_value=self._mock_ollama_transport(handler)):
+                with self.assertRaises(RuntimeError) as context:
+                    asyncio.run(self.llm.generate_report_async(self.system_prompt, self.github_content))
+
+        self.assertEqual(len(calls), llm_module.MAX_RETRIES + 1)
+        self.assertIn("429", str(context.exception))
+
+    def test_async_calls_limited_by_max_concurrent_llm(self):
+        """
+        测试同时进行的异步模型调用数量不超过 max_concurrent_llm。
+        """
+        self.config.max_concurrent_llm = 2
+        llm = LLM(self.config)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def run():
+            nonlocal in_flight, max_in_flight
+            release = asyncio.Event()
+
+            async def handler(request):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await release.wait()  # 阻塞请求，直到测试放行
+                in_flight -= 1
+                return httpx.Response(200, text=json.dumps({"message": {"content": "report"}, "done": True}))
+
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            with patch.object(llm, '_get_async_http_client', return_value=client):
+                tasks = [asyncio.create_task(llm.generate_report_async(self.system_prompt, f"content {i}")) for i in range(5)]
+                # 等待达到并发上限后，再让事件循环多运行几轮，确认没有更多请求进入
+                while in_flight < self.config.max_concurrent_llm:
+                    await asyncio.sleep(0)
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                release.set()
+                return await asyncio.gather(*tasks)
+
+        reports = asyncio.run(run())
+        self.assertEqual(reports, ["report"] * 5)
+        self.assertEqual(max_in_flight, self.config.max_concurrent_llm)
+
+    @patch('requests.post')
+    def test_report_cache_hit_skips_model_call(self, mock_post):
+        """
+        测试启用报告缓存时，相同的提示和内容只调用一次模型。
+        """
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"message": {"content": "Cached report"}}
+        mock_post.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.config.llm_cache_enabled = True
+            self.config.llm_cache_dir = cache_dir
+            llm = LLM(self.config)
+
+            first_report = llm.generate_report(self.system_prompt, self.github_content)
+            second_report = llm.generate_report(self.system_prompt, self.github_content)
+            llm._cache.close()
+
+        self.assertEqual(first_report, "Cached report")
+        self.assertEqual(second_report, "Cached report")
+        mock_post.assert_called_once()
+
     @patch('llm.LOG.error')
-    @patch('llm.OpenAI')
+    @patch('openai.OpenAI')
     def test_openai_exception_handling(self, mock_openai, mock_log_error):
         """
         测试调用 OpenAI 模型时发生异常的错误处理路径。
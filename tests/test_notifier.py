@@ -74,6 +74,33 @@ class TestNotifier(unittest.TestCase):
         log_content = self.log_capture.getvalue()
         self.assertIn("邮件发送成功！", log_content)
 
+    @patch.object(Notifier, 'send_email')
+    def test_notify_github_reports_batch(self, mock_send_email):
+        """
+        测试多个 GitHub 报告是否合并为一封邮件发送，且邮件内容包含目录和所有报告。
+        """
+        reports = [(self.test_repo, self.test_github_report), ("some/repo", "# some/repo 项目进展")]
+        self.notifier.notify_github_reports(reports)
+
+        mock_send_email.assert_called_once()
+        subject, body = mock_send_email.call_args.args
+        self.assertEqual(subject, "[GitHub] 2 个项目进展简报")
+        self.assertIn(f"- {self.test_repo}\n- some/repo", body)
+        self.assertIn(self.test_github_report, body)
+        self.assertIn("# some/repo 项目进展", body)
+
+    @patch.object(Notifier, 'send_email')
+    def test_notify_github_reports_per_repo(self, mock_send_email):
+        """
+        测试开启 notify_per_repo 时，每个 GitHub 报告是否单独发送一封邮件。
+        """
+        notifier = Notifier(self.config.email, notify_per_repo=True)
+        reports = [(self.test_repo, self.test_github_report), ("some/repo", "# some/repo 项目进展")]
+        notifier.notify_github_reports(reports)
+
+        self.assertEqual(mock_send_email.call_count, 2)
+        mock_send_email.assert_any_call(f"[GitHub] {self.test_repo} 进展简报", self.test_github_report)
+
     def test_notify_without_email_settings(self):
         """
         测试当邮件设置未正确配置时，Notifier 是否不会发送邮件并记录相应的警告日志。
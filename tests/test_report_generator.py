@@ -1,18 +1,22 @@
 import sys
 import os
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, AsyncMock, patch
 
 # 添加 src 目录到模块搜索路径，以便可以导入 src 目录中的模块
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-from report_generator import ReportGenerator  # 导入要测试的 ReportGenerator 类
+from report_generator import ReportGenerator, _load_prompt  # 导入要测试的 ReportGenerator 类和提示文件读取函数
 
 class TestReportGenerator(unittest.TestCase):
     def setUp(self):
         """
         在每个测试方法之前运行，初始化测试环境。
         """
+        # 清空提示文件的读取缓存，避免不同测试之间互相影响
+        _load_prompt.cache_clear()
+
         # 创建一个模拟的 LLM（大语言模型）对象
         self.mock_llm = MagicMock()
         self.mock_llm.model = "mock_model"  # 确保mock对象有一个有效的模型名称
@@ -79,6 +83,20 @@ class TestReportGenerator(unittest.TestCase):
                 os.remove(os.path.join(self.test_hn_daily_dir_path, file))
             os.rmdir(self.test_hn_daily_dir_path)
 
+    @patch('report_generator.os.path.exists', return_value=True)
+    @patch('report_generator.pathlib.Path.read_text', return_value="prompt content")
+    def test_prompt_files_read_once(self, mock_read_text, mock_exists):
+        """
+        测试多次创建 ReportGenerator 时，每个提示文件只从磁盘读取一次。
+        """
+        report_types = ["github", "hacker_news_hours_topic", "hacker_news_daily_report"]
+        first_generator = ReportGenerator(self.mock_llm, report_types)
+        second_generator = ReportGenerator(self.mock_llm, report_types)
+
+        self.assertEqual(mock_read_text.call_count, len(report_types))
+        self.assertEqual(first_generator.prompts, second_generator.prompts)
+        self.assertEqual(second_generator.prompts["github"], "prompt content")
+
     @patch.object(ReportGenerator, '_preload_prompts', return_value=None)
     def test_generate_github_report(self, mock_preload_prompts):
         """
@@ -107,6 +125,30 @@ class TestReportGenerator(unittest.TestCase):
         # 验证 LLM 的 generate_report 方法是否被正确调用，且传入了正确的参数
         self.mock_llm.generate_report.assert_called_once_with(self.mock_prompts["github"], self.markdown_content)
 
+    @patch.object(ReportGenerator, '_preload_prompts', return_value=None)
+    def test_generate_github_report_async(self, mock_preload_prompts):
+        """
+        测试 generate_github_report_async 方法是否正确异步生成报告并保存到文件。
+        """
+        # 初始化 ReportGenerator 实例，并手动设置 prompts
+        self.report_generator = ReportGenerator(self.mock_llm, ["github", "hacker_news_hours_topic", "hacker_news_daily_report"])
+        self.report_generator.prompts = self.mock_prompts
+
+        # 模拟 LLM 异步返回的报告内容
+        mock_report = "This is a generated report."
+        self.mock_llm.generate_report_async = AsyncMock(return_value=mock_report)
+
+        # 调用 generate_github_report_async 方法
+        report, report_file_path = asyncio.run(self.report_generator.generate_github_report_async(self.test_markdown_file_path))
+
+        # 验证返回值和生成的报告文件内容是否正确
+        self.assertEqual(report, mock_report)
+        with open(report_file_path, 'r') as file:
+            self.assertEqual(file.read(), mock_report)
+
+        # 验证 LLM 的 generate_report_async 方法是否被正确调用，且传入了正确的参数
+        self.mock_llm.generate_report_async.assert_awaited_once_with(self.mock_prompts["github"], self.markdown_content)
+
     @patch.object(ReportGenerator, '_preload_prompts', return_value=None)
     def test_generate_hn_topic_report(self, mock_preload_prompts):
         """
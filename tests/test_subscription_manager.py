@@ -2,6 +2,7 @@ import sys
 import os
 import unittest
 import json
+import tempfile
 from unittest.mock import patch, mock_open, call
 
 # 添加 src 目录到模块搜索路径，以便可以导入 src 目录中的模块
@@ -23,14 +24,16 @@ class TestSubscriptionManager(unittest.TestCase):
         # 创建 SubscriptionManager 实例，并设置初始数据
         manager = SubscriptionManager(self.subscriptions_file)
         manager.subscriptions = self.initial_data
-        manager.save_subscriptions()
+        with patch('subscription_manager.write_file_atomic') as mock_write:
+            manager.save_subscriptions()
         
-        # 验证 open 函数是否被调用，分别用于读取和写入文件
+        # 验证 open 函数是否被调用以读取文件，写入则通过原子写入函数完成
         mock_file.assert_any_call(self.subscriptions_file, 'r')  # 检查读取操作
-        mock_file.assert_any_call(self.subscriptions_file, 'w')  # 检查写入操作
+        mock_write.assert_called_once()  # 检查写入操作
 
         # 提取写入的字符串内容，并验证写入内容是否正确
-        written_data = ''.join([call_arg.args[0] for call_arg in mock_file().write.call_args_list])
+        file_path, written_data = mock_write.call_args.args
+        self.assertEqual(file_path, self.subscriptions_file)
         self.assertEqual(json.loads(written_data), self.initial_data)
 
     @patch('builtins.open', new_callable=mock_open, read_data=json.dumps(["DjangoPeng/openai-quickstart", "some/repo"]))
@@ -62,6 +65,49 @@ class TestSubscriptionManager(unittest.TestCase):
         # 验证 open 函数是否正确调用以读取文件
         mock_file.assert_called_once_with(self.subscriptions_file, 'r')
 
+    def test_list_subscriptions_reloads_modified_file(self):
+        """
+        测试订阅文件被外部修改后，list_subscriptions 方法是否重新加载订阅列表，未修改时不重复读取。
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            subscriptions_file = os.path.join(tmp_dir, self.subscriptions_file)
+            with open(subscriptions_file, 'w') as f:
+                json.dump(["DjangoPeng/openai-quickstart"], f)
+
+            manager = SubscriptionManager(subscriptions_file)
+
+            # 文件未修改时，直接返回内存中的订阅列表
+            with patch.object(manager, 'load_subscriptions') as mock_load:
+                self.assertEqual(manager.list_subscriptions(), ["DjangoPeng/openai-quickstart"])
+                mock_load.assert_not_called()
+
+            # 模拟其他进程修改了订阅文件
+            with open(subscriptions_file, 'w') as f:
+                json.dump(["DjangoPeng/openai-quickstart", "new/repo"], f)
+            stat = os.stat(subscriptions_file)
+            os.utime(subscriptions_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(manager.list_subscriptions(), ["DjangoPeng/openai-quickstart", "new/repo"])
+
+    def test_list_subscriptions_keeps_list_on_truncated_file(self):
+        """
+        测试订阅文件被修改为不完整的内容时，list_subscriptions 方法是否保留内存中已有的订阅列表。
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            subscriptions_file = os.path.join(tmp_dir, self.subscriptions_file)
+            with open(subscriptions_file, 'w') as f:
+                json.dump(["DjangoPeng/openai-quickstart"], f)
+
+            manager = SubscriptionManager(subscriptions_file)
+
+            # 模拟读取到写了一半的订阅文件
+            with open(subscriptions_file, 'w') as f:
+                f.write('["DjangoPeng/openai-quickstart", "new/re')
+            stat = os.stat(subscriptions_file)
+            os.utime(subscriptions_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(manager.list_subscriptions(), ["DjangoPeng/openai-quickstart"])
+
     @patch('builtins.open', new_callable=mock_open, read_data=json.dumps(["DjangoPeng/openai-quickstart"]))
     def test_add_subscription(self, mock_file):
         """
@@ -69,16 +115,18 @@ class TestSubscriptionManager(unittest.TestCase):
         """
         # 创建 SubscriptionManager 实例，并添加新的订阅
         manager = SubscriptionManager(self.subscriptions_file)
-        manager.add_subscription("new/repo")
+        with patch('subscription_manager.write_file_atomic') as mock_write:
+            manager.add_subscription("new/repo")
         
         # 验证新的订阅是否正确添加到订阅列表中
         self.assertIn("new/repo", manager.subscriptions)
         
-        # 验证 open 函数是否正确调用以写入文件
-        mock_file.assert_called_with(self.subscriptions_file, 'w')
+        # 验证是否通过原子写入函数写入订阅文件
+        mock_write.assert_called_once()
         
         # 提取写入的字符串内容，并验证写入的内容是否正确
-        written_data = ''.join([call_arg.args[0] for call_arg in mock_file().write.call_args_list])
+        file_path, written_data = mock_write.call_args.args
+        self.assertEqual(file_path, self.subscriptions_file)
         self.assertEqual(json.loads(written_data), ["DjangoPeng/openai-quickstart", "new/repo"])
 
     @patch('builtins.open', new_callable=mock_open, read_data=json.dumps(["DjangoPeng/openai-quickstart", "some/repo"]))
@@ -88,16 +136,18 @@ class TestSubscriptionManager(unittest.TestCase):
         """
         # 创建 SubscriptionManager 实例，并移除指定的订阅
         manager = SubscriptionManager(self.subscriptions_file)
-        manager.remove_subscription("some/repo")
+        with patch('subscription_manager.write_file_atomic') as mock_write:
+            manager.remove_subscription("some/repo")
         
         # 验证订阅列表中是否已移除指定的订阅
         self.assertNotIn("some/repo", manager.subscriptions)
         
-        # 验证 open 函数是否正确调用以写入文件
-        mock_file.assert_called_with(self.subscriptions_file, 'w')
+        # 验证是否通过原子写入函数写入订阅文件
+        mock_write.assert_called_once()
         
         # 提取写入的字符串内容，并验证写入的内容是否正确
-        written_data = ''.join([call_arg.args[0] for call_arg in mock_file().write.call_args_list])
+        file_path, written_data = mock_write.call_args.args
+        self.assertEqual(file_path, self.subscriptions_file)
         self.assertEqual(json.loads(written_data), ["DjangoPeng/openai-quickstart"])
 
 if __name__ == '__main__':